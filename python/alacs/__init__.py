@@ -1,10 +1,8 @@
-from abc import ABC
 from collections import UserString
 from collections.abc import Mapping, Sequence
-from io import BytesIO, StringIO
 from typing import Any, ClassVar, TypeAlias
 
-from .pointer import Indent
+from .pointer import Indent, _tabs
 
 # multiple inheritance (from builtins in particular) means that __slots__ and __init__
 # must be written as below to avoid TypeError about instance lay-out conflict.
@@ -49,36 +47,17 @@ class UTF8(list[Encoded]):
         self._repr_args(args)
         return f"{self.__class__.__name__}({','.join(args)})"
 
-    def normalize(self, scratch: list[Encoded] | None) -> None:
+    def normalize(self, scratch: list[Encoded] | None = None) -> None:
+        # `scratch` is no longer needed, but still accepted from existing callers.
         if 1 == len(self) and 0 == len(self[0]):
             self.clear()  # `[]` is more "True"ly empty than `[b'']`
         else:
-            if scratch is None:
-                scratch = list[Encoded]()
-            else:
-                scratch.clear()
             for index in range(len(self) - 1, -1, -1):
                 chunk = self[index]
-                if not isinstance(chunk, memoryview):
-                    if b"\n" not in chunk:
-                        continue
-                    chunk = memoryview(chunk)
-                start = len(chunk) - 1
-                while 0 <= start and 10 != chunk[start]:
-                    start -= 1
-                if 0 <= start:
-                    scratch.append(chunk[start + 1 :])
-                    limit = start
-                    start -= 1
-                    while start >= 0:
-                        if 10 == chunk[start]:
-                            scratch.append(chunk[start + 1 : limit])
-                            limit = start
-                        start -= 1
-                    scratch.append(chunk[:limit])
-                    scratch.reverse()
-                    self[index : index + 1] = scratch
-                    scratch.clear()
+                if isinstance(chunk, memoryview):
+                    chunk = chunk.tobytes()  # for the C-level `in` and `split`
+                if b"\n" in chunk:
+                    self[index : index + 1] = chunk.split(b"\n")
 
 
 # =====================================================================================
@@ -91,7 +70,7 @@ class Comment(UTF8):
         super().__init__(*lines)
 
 
-class Value(ABC):
+class Value:
     comment_after: Comment | None  # = None
     __slots__ = ()
 
@@ -144,13 +123,16 @@ class List(list[Value], Value):
 class Key(str):
     blank_line_before: bool  # = False
     comment_before: Comment | None  # = None
-    __slots__ = ("blank_line_before", "comment_before")
+    # cached `str.encode` result, see `ALACS._writeDict`
+    _utf8: bytes | None  # = None
+    __slots__ = ("blank_line_before", "comment_before", "_utf8")
 
     def __init__(self, handled_by_str_new_but_here_for_type_hint: Any):
         if "\n" in self:
             raise ValueError("newline in key")
         self.blank_line_before = False
         self.comment_before = None
+        self._utf8 = None
 
 
 class Dict(dict[Key, Value], Value):
@@ -167,9 +149,9 @@ class Dict(dict[Key, Value], Value):
         if isinstance(intro, File):
             super().__init__(intro)
             self.comment_intro = intro.comment_intro
-            self.update((Key(k), v) for k, v in values.items())
+            self.update({Key(k): v for k, v in values.items()})
         else:
-            super().__init__((Key(k), v) for k, v in values.items())
+            super().__init__({Key(k): v for k, v in values.items()})
             self.comment_intro = intro
         self.comment_after = after
 
@@ -203,9 +185,9 @@ class File(dict[Key, Value]):
         if isinstance(intro, Dict):
             super().__init__(intro)
             self.comment_intro = intro.comment_intro
-            self.update((Key(k), v) for k, v in values.items())
+            self.update({Key(k): v for k, v in values.items()})
         else:
-            super().__init__((Key(k), v) for k, v in values.items())
+            super().__init__({Key(k): v for k, v in values.items()})
             self.comment_intro = intro
         self.hashbang = hashbang
 
@@ -230,29 +212,33 @@ class File(dict[Key, Value]):
 class ALACS:
     empty: ClassVar[memoryview] = memoryview(b"")
     __slots__ = (
-        "_scratch",
         "_errors",
         "_indent",
         "_count",
         "_write",
         "_parse",
+        "_lines",
+        "_lineno",
         "_next",
         "_line",
         "_tabs",
+        "_lead",
         "_assign",
     )
 
     def __init__(self):
         super().__init__()
-        self._scratch = list[Encoded]()
         self._errors = list[str]()
         self._indent: Indent = Indent(b"")
         self._count: int = 0
-        self._write = BytesIO()
+        self._write = bytearray()
         self._parse = ALACS.empty
+        self._lines = list[bytes | bytearray]()
+        self._lineno: int = -1
         self._next: int = -1
         self._line = ALACS.empty
         self._tabs: int = -1
+        self._lead: int = -1
         self._assign: int = -1
 
     # -------------------------------------------------------------------------- errors
@@ -265,14 +251,11 @@ class ALACS:
                 return f"{message}:\n\t{'\n\t'.join(self._errors)}"
 
     def _errors_add(self, *parts: Any) -> None:
-        message = StringIO()
-        if self._count:
-            message.write(f"#{self._count}: ")
-        for part in parts:
-            message.write(f"{part} ")
-        message.write("@")
-        self._indent.path(message)
-        self._errors.append(message.getvalue())
+        message = [f"#{self._count}: "] if self._count else []
+        message.extend([f"{part} " for part in parts])
+        message.append("@")
+        message.append(self._indent.path())
+        self._errors.append("".join(message))
 
     # ----------------------------------------------------------------------- to python
 
@@ -299,38 +282,54 @@ class ALACS:
             self._indent = self._indent.zero()
 
     def _python(self, any: Value | File) -> str | list | dict | None:
-        match any:
+        kind = type(any)
+        if kind is Text:
+            return self._pythonText(any)
+        if kind is List:
+            return self._pythonList(any)
+        if kind is Dict or kind is File:
+            return self._pythonDict(any)
+        match any:  # subclasses miss the exact-type dispatch
             case Text():
-                return str(any)
+                return self._pythonText(any)
             case List():
-                result = list()
-                self._indent = self._indent.more()
-                for key, value in enumerate(any):
-                    self._indent.key = key
-                    result.append(self._python(value))
-                self._indent = self._indent.less()
-                return result
+                return self._pythonList(any)
             case Dict() | File():
-                result = dict()
-                self._indent = self._indent.more()
-                for key, value in any.items():
-                    self._indent.key = key
-                    match key:
-                        case Key():
-                            result[str(key)] = self._python(value)
-                        case other:
-                            self._errors_add("key is", type(other))
-                self._indent = self._indent.less()
-                return result
+                return self._pythonDict(any)
         self._errors_add("value is", type(any))
         return None
 
+    def _pythonText(self, any: Text) -> str:
+        return str(any)
+
+    def _pythonList(self, any: List) -> list:
+        result = list()
+        self._indent = self._indent.more()
+        for key, value in enumerate(any):
+            self._indent.key = key
+            result.append(self._python(value))
+        self._indent = self._indent.less()
+        return result
+
+    def _pythonDict(self, any: Dict | File) -> dict:
+        result = dict()
+        self._indent = self._indent.more()
+        for key, value in any.items():
+            self._indent.key = key
+            match key:
+                case Key():
+                    result[str(key)] = self._python(value)
+                case other:
+                    self._errors_add("key is", type(other))
+        self._indent = self._indent.less()
+        return result
+
     # --------------------------------------------------------------------- from python
 
     def file(self, mapping: Mapping) -> File:
         """Convert a simple Python `dict` (any mapping) to a `File`.
 
-        Returns deep copy except bytes/bytearray/memoryview are shared
+        Returns deep copy except bytes/bytearray/memoryview without newlines are shared
         (even though some of those are mutable)."""
         self._errors.clear()
         self._indent = self._indent.zero()
@@ -345,44 +344,62 @@ class ALACS:
                 case other:
                     raise AssertionError(f"impossible: got {type(other)}")
         finally:
-            self._scratch.clear()
             self._errors.clear()
             self._indent = self._indent.zero()
 
     def _value(self, any: Any) -> Value | None:
-        match any:
-            case None:
-                return Text()
+        kind = type(any)
+        if kind is str or kind is bytes or kind is bytearray or kind is memoryview:
+            return self._valueText(any)
+        if kind is dict:
+            return self._valueDict(any)
+        if kind is list or kind is tuple:
+            return self._valueList(any)
+        if any is None:
+            return self._valueNone(any)
+        match any:  # subclasses and ABCs miss the exact-type dispatch
             case str() | UserString() | bytes() | bytearray() | memoryview():
-                result = Text(any)
-                result.normalize(self._scratch)
-                return result
+                return self._valueText(any)
             case Sequence():
-                result = List()
-                self._indent = self._indent.more()
-                for i, v in enumerate(any):
-                    self._indent.key = i
-                    x = self._value(v)
-                    if x is not None:
-                        result.append(x)
-                self._indent = self._indent.less()
-                return result
+                return self._valueList(any)
             case Mapping():
-                result = Dict()
-                self._indent = self._indent.more()
-                for k, v in any.items():
-                    self._indent.key = k
-                    if isinstance(k, (str, UserString)):
-                        x = self._value(v)
-                        if x is not None:
-                            result[Key(k)] = x
-                    else:
-                        self._errors_add("key is", type(k))
-                self._indent = self._indent.less()
-                return result
+                return self._valueDict(any)
         self._errors_add("value is", type(any))
         return None
 
+    def _valueNone(self, any: None) -> Text:
+        return Text()
+
+    def _valueText(self, any: str | UserString | Encoded) -> Text:
+        result = Text(any)
+        result.normalize()
+        return result
+
+    def _valueList(self, any: Sequence) -> List:
+        result = List()
+        self._indent = self._indent.more()
+        for i, v in enumerate(any):
+            self._indent.key = i
+            x = self._value(v)
+            if x is not None:
+                result.append(x)
+        self._indent = self._indent.less()
+        return result
+
+    def _valueDict(self, any: Mapping) -> Dict:
+        result = Dict()
+        self._indent = self._indent.more()
+        for k, v in any.items():
+            self._indent.key = k
+            if isinstance(k, (str, UserString)):
+                x = self._value(v)
+                if x is not None:
+                    result[Key(k)] = x
+            else:
+                self._errors_add("key is", type(k))
+        self._indent = self._indent.less()
+        return result
+
     # -------------------------------------------------------------------------- encode
 
     def encode(self, file: File) -> memoryview:
@@ -391,42 +408,36 @@ class ALACS:
         self._indent = self._indent.zero()
         try:
             self._count = 0
-            self._write.seek(0)
-            self._write.truncate()
+            self._write.clear()
             self._writeComment(b"#!", file.hashbang)
             self._writeDict(file)
             if self._errors:
                 raise ValueError(self._error("illegal non-`Value` data"))
-            return self._write.getbuffer()
+            return memoryview(self._write)[1:]  # drop LF preceding the first line
         finally:
-            self._scratch.clear()
             self._errors.clear()
             self._indent = self._indent.zero()
 
     def _writeIndent(self) -> None:
-        if self._count:
-            self._write.write(b"\n")
-            self._count += 1
-        else:
-            self._count = 1
-        self._write.write(self._indent._bytes)
+        self._count += 1
+        self._write += self._indent._newline
 
     def _writeComment(self, marker: bytes, comment: Comment | None) -> None:
         if comment is not None:
             self._writeIndent()
-            self._write.write(marker)
-            comment.normalize(self._scratch)
+            self._write += marker
+            comment.normalize()
             if comment:
-                self._write.write(comment[0])
+                self._write += comment[0]
                 self._indent = self._indent.more()
                 for index in range(1, len(comment)):
                     self._writeIndent()
-                    self._write.write(comment[index])
+                    self._write += comment[index]
                 self._indent = self._indent.less()
 
     def _shortList(self, text: Text) -> bool:
         """check if encoding should use short List item syntax."""
-        text.normalize(self._scratch)
+        text.normalize()
         match len(text):
             case 0:
                 return True
@@ -434,40 +445,57 @@ class ALACS:
                 return text[0][0] not in b"\t#<>[]{}/="
         return False
 
+    def _valueClass(self, value: Any) -> type | None:
+        """`Text`, `List` or `Dict` when `value` is an instance, else `None`."""
+        match value:
+            case Text():
+                return Text
+            case List():
+                return List
+            case Dict():
+                return Dict
+        return None
+
     def _writeList(self, array: List) -> None:
-        self._writeComment(b"#", array.comment_intro)
+        out = self._write  # a local, not a slot, for the hot appends below
+        if array.comment_intro is not None:
+            self._writeComment(b"#", array.comment_intro)
         for index, value in enumerate(array):
             self._indent.key = index
-            self._writeIndent()
-            match value:
-                case Text():
-                    if not self._shortList(value):
-                        self._write.write(b"<>")
-                        self._indent = self._indent.more()
-                        for line in value:
-                            self._writeIndent()
-                            self._write.write(line)
-                        self._indent = self._indent.less()
-                    elif value:
-                        self._write.write(value[0])
-                case List():
-                    self._write.write(b"[]")
-                    self._indent = self._indent.more()
-                    self._writeList(value)
-                    self._indent = self._indent.less()
-                case Dict():
-                    self._write.write(b"{}")
+            self._count += 1  # inlined `_writeIndent`
+            out += self._indent._newline
+            kind = type(value)
+            if kind is not Text and kind is not List and kind is not Dict:
+                kind = self._valueClass(value)  # subclass, or not a `Value`
+            if kind is Text:
+                if not self._shortList(value):
+                    out += b"<>"
                     self._indent = self._indent.more()
-                    self._writeDict(value)
+                    for line in value:
+                        self._writeIndent()
+                        out += line
                     self._indent = self._indent.less()
-                case _:
-                    self._errors_add("value is", type(value))
-                    continue
-            self._writeComment(b"#", value.comment_after)
+                elif value:
+                    out += value[0]
+            elif kind is List:
+                out += b"[]"
+                self._indent = self._indent.more()
+                self._writeList(value)
+                self._indent = self._indent.less()
+            elif kind is Dict:
+                out += b"{}"
+                self._indent = self._indent.more()
+                self._writeDict(value)
+                self._indent = self._indent.less()
+            else:
+                self._errors_add("value is", type(value))
+                continue
+            if value.comment_after is not None:
+                self._writeComment(b"#", value.comment_after)
 
     def _shortDict(self, key: Key, text: Text) -> bool:
         """check if encoding should use short Dict entry syntax."""
-        text.normalize(self._scratch)
+        text.normalize()
         if len(text) > 1:
             return False
         if not key:
@@ -479,7 +507,9 @@ class ALACS:
         return True
 
     def _writeDict(self, array: Dict | File) -> None:
-        self._writeComment(b"#", array.comment_intro)
+        out = self._write  # a local, not a slot, for the hot appends below
+        if array.comment_intro is not None:
+            self._writeComment(b"#", array.comment_intro)
         for key, value in array.items():
             self._indent.key = key
             if not isinstance(key, Key):
@@ -488,42 +518,50 @@ class ALACS:
                 continue
             if key.blank_line_before:
                 self._writeIndent()
-            self._writeComment(b"//", key.comment_before)
-            self._writeIndent()
-            match value:
-                case Text():
-                    if not self._shortDict(key, value):
-                        self._write.write(b"<")
-                        self._write.write(key.encode())
-                        self._write.write(b">")
-                        self._indent = self._indent.more()
-                        for line in value:
-                            self._writeIndent()
-                            self._write.write(line)
-                        self._indent = self._indent.less()
-                    else:
-                        self._write.write(key.encode())
-                        self._write.write(b"=")
-                        if value:
-                            self._write.write(value[0])
-                case List():
-                    self._write.write(b"[")
-                    self._write.write(key.encode())
-                    self._write.write(b"]")
+            if key.comment_before is not None:
+                self._writeComment(b"//", key.comment_before)
+            self._count += 1  # inlined `_writeIndent`
+            out += self._indent._newline
+            utf8 = key._utf8
+            if utf8 is None:
+                utf8 = key._utf8 = str.encode(key)
+            kind = type(value)
+            if kind is not Text and kind is not List and kind is not Dict:
+                kind = self._valueClass(value)  # subclass, or not a `Value`
+            if kind is Text:
+                if not self._shortDict(key, value):
+                    out += b"<"
+                    out += utf8
+                    out += b">"
                     self._indent = self._indent.more()
-                    self._writeList(value)
+                    for line in value:
+                        self._writeIndent()
+                        out += line
                     self._indent = self._indent.less()
-                case Dict():
-                    self._write.write(b"{")
-                    self._write.write(key.encode())
-                    self._write.write(b"}")
-                    self._indent = self._indent.more()
-                    self._writeDict(value)
-                    self._indent = self._indent.less()
-                case _:
-                    self._errors_add("value is", type(value))
-                    continue
-            self._writeComment(b"#", value.comment_after)
+                else:
+                    out += utf8
+                    out += b"="
+                    if value:
+                        out += value[0]
+            elif kind is List:
+                out += b"["
+                out += utf8
+                out += b"]"
+                self._indent = self._indent.more()
+                self._writeList(value)
+                self._indent = self._indent.less()
+            elif kind is Dict:
+                out += b"{"
+                out += utf8
+                out += b"}"
+                self._indent = self._indent.more()
+                self._writeDict(value)
+                self._indent = self._indent.less()
+            else:
+                self._errors_add("value is", type(value))
+                continue
+            if value.comment_after is not None:
+                self._writeComment(b"#", value.comment_after)
 
     # -------------------------------------------------------------------------- decode
 
@@ -533,6 +571,14 @@ class ALACS:
         try:
             self._count = 0
             self._parse = memoryview(alacs)
+            # split every line in one C-level pass, trading memory for speed: the
+            # pieces are copies, so the input is held about twice over until decode
+            # returns, plus once more for input that `split` needs as `bytes` first.
+            # `_readln` keeps `_next` in step so `_line` is still a view of `_parse`.
+            if not isinstance(alacs, (bytes, bytearray)):
+                alacs = self._parse.tobytes()
+            self._lines = alacs.split(b"\n")
+            self._lineno = 0
             self._next = 0
             self._indent.key = ""
             self._readln()
@@ -544,10 +590,10 @@ class ALACS:
                 raise ValueError(self._error("parse errors"))
             return file
         finally:
-            self._scratch.clear()
             self._errors.clear()
             self._indent = self._indent.zero()
             self._parse = self._line = ALACS.empty
+            self._lines.clear()
 
     def _readln(self) -> bool:
         index = self._next
@@ -556,34 +602,27 @@ class ALACS:
             if self._line is not ALACS.empty:
                 self._count += 1
                 self._line = ALACS.empty
-                self._tabs = self._assign = -1
+                self._tabs = self._lead = self._assign = -1
             return False
-        byte = self._parse[index]
-        while byte == 9:
-            index += 1
-            if index >= limit:
-                byte = 10
-                break
-            byte = self._parse[index]
-        self._tabs = index - self._next
-        self._assign = -1
-        while byte != 10:
-            if byte == 61 and self._assign < 0:
-                self._assign = index - self._next
-            index += 1
-            if index >= limit:
-                break
-            byte = self._parse[index]
+        raw = self._lines[self._lineno]
+        self._lineno += 1
+        index += len(raw)
+        self._tabs = len(raw) - len(raw.lstrip(b"\t"))
+        # first byte after the indent, LF for a blank line: this is what decides
+        # whether the line is a comment, a value, an array, etc.
+        self._lead = raw[self._tabs] if self._tabs < len(raw) else 10
+        self._assign = raw.find(61, self._tabs)
         self._line = self._parse[self._next : index]
         self._count += 1
         self._next = index + 1
         return True
 
     def _readExcess(self) -> None:
-        if self._tabs > len(self._indent):
+        indent = len(self._indent)
+        if self._tabs > indent:
             starting_line = self._count
             count = 1
-            while self._readln() and self._tabs > len(self._indent):
+            while self._readln() and self._tabs > indent:
                 count += 1
             self._count = starting_line  # so error message has the right line
             if count > 1:
@@ -592,18 +631,39 @@ class ALACS:
                 self._errors_add("excess indentation")
             self._count += count
 
+    def _readNested(self, lines: UTF8) -> None:
+        """append the lines indented deeper than `_indent`, then `_readln` past them.
+
+        the hot loop of the decoder, so it works on locals instead of via `_readln`."""
+        indent = len(self._indent) + 1
+        tabs = _tabs(indent)  # shared per depth, not rebuilt per block
+        parse = self._parse
+        split = self._lines
+        lineno = self._lineno
+        start = self._next
+        limit = len(parse)
+        while start < limit and split[lineno].startswith(tabs):
+            stop = start + len(split[lineno])
+            lines.append(parse[start + indent : stop])
+            lineno += 1
+            start = stop + 1
+        self._count += lineno - self._lineno
+        self._lineno = lineno
+        self._next = start
+        self._readln()
+
+    def _readKey(self, start: int, stop: int) -> Key:
+        """slice the `bytes` behind `_line`, skipping a memoryview `tobytes` copy."""
+        return Key(self._lines[self._lineno - 1][start:stop].decode())
+
     def _readComment(self, start: int) -> Comment:
         comment = Comment(self._line[start:])
-        indent = len(self._indent) + 1
-        while self._readln() and self._tabs >= indent:
-            comment.append(self._line[indent:])
+        self._readNested(comment)
         return comment
 
     def _readText(self) -> Text:
         text = Text()
-        indent = len(self._indent) + 1
-        while self._readln() and self._tabs >= indent:
-            text.append(self._line[indent:])
+        self._readNested(text)
         if len(text) == 1 and len(text[0]) == 0:
             text.clear()
         return text
@@ -614,15 +674,17 @@ class ALACS:
         indent = len(self._indent)
         if self._tabs < indent:
             return
-        if len(self._line) > indent and self._line[indent] == 35:
+        if self._lead == 35:
             array.comment_intro = self._readComment(indent + 1)
         self._readExcess()
+        append = array.append
         while self._tabs == indent:
             self._indent.key = len(array)
-            size = len(self._line) - indent
+            line = self._line
+            size = len(line) - indent
             assert size >= 0
             value: Value | None = None
-            match 10 if size == 0 else self._line[indent]:
+            match self._lead:
                 case 10:
                     value = Text()
                     self._readln()
@@ -633,13 +695,13 @@ class ALACS:
                     self._errors_add("key comment in list context")
                     self._readComment(indent)
                 case 60:
-                    if size != 2 or self._line[-1] != 62:
+                    if size != 2 or line[-1] != 62:
                         self._errors_add("malformed text opening")
                         self._readln()
                     else:
                         value = self._readText()
                 case 91:
-                    if size != 2 or self._line[-1] != 93:
+                    if size != 2 or line[-1] != 93:
                         self._errors_add("malformed linear array opening")
                         self._readln()
                     else:
@@ -649,7 +711,7 @@ class ALACS:
                         self._readList(value)
                         self._indent = self._indent.less()
                 case 123:
-                    if size != 2 or self._line[-1] != 125:
+                    if size != 2 or line[-1] != 125:
                         self._errors_add("malformed associative array opening")
                         self._readln()
                     else:
@@ -659,14 +721,14 @@ class ALACS:
                         self._readDict(value)
                         self._indent = self._indent.less()
                 case _:
-                    value = Text(self._line[indent:])
+                    value = Text(line[indent:])
                     self._readln()
             if value is not None:
-                if self._tabs == indent:
-                    if len(self._line) > indent and self._line[indent] == 35:
-                        value.comment_after = self._readComment(indent + 1)
-                array.append(value)
-            self._readExcess()
+                if self._tabs == indent and self._lead == 35:
+                    value.comment_after = self._readComment(indent + 1)
+                append(value)
+            if self._tabs > indent:
+                self._readExcess()
 
     def _readDict(self, array: Dict | File) -> None:
         self._indent.key = ""
@@ -674,16 +736,17 @@ class ALACS:
         indent = len(self._indent)
         if self._tabs < indent:
             return
-        if len(self._line) > indent and self._line[indent] == 35:
+        if self._lead == 35:
             array.comment_intro = self._readComment(indent + 1)
         entries = 0
         blank = 0
         comment: Comment | None = None
         self._readExcess()
         while self._tabs == indent:
-            size = len(self._line) - indent
+            line = self._line
+            size = len(line) - indent
             assert size >= 0
-            if size == 0:
+            if self._lead == 10:
                 if comment:
                     self._errors_add("blank line must precede key comment")
                 elif blank:
@@ -695,12 +758,12 @@ class ALACS:
             key: Key | None = None
             self._indent.key = key
             value: Value | None = None
-            match self._line[indent]:
+            match self._lead:
                 case 35:
                     self._errors_add("illegal position for comment")
                     self._readComment(indent + 1)
                 case 47:
-                    if size < 2 or self._line[indent + 1] != 47:
+                    if size < 2 or line[indent + 1] != 47:
                         self._errors_add("malformed key comment")
                         self._readComment(indent)
                     elif comment:
@@ -709,19 +772,19 @@ class ALACS:
                     else:
                         comment = self._readComment(indent + 2)
                 case 60:
-                    if size < 2 or self._line[-1] != 62:
+                    if size < 2 or line[-1] != 62:
                         self._errors_add("malformed text opening")
                         self._readln()
                     else:
-                        key = Key(self._line[indent + 1 : -1].tobytes().decode())
+                        key = self._readKey(indent + 1, -1)
                         self._indent.key = key
                         value = self._readText()
                 case 91:
-                    if size < 2 or self._line[-1] != 93:
+                    if size < 2 or line[-1] != 93:
                         self._errors_add("malformed linear array opening")
                         self._readln()
                     else:
-                        key = Key(self._line[indent + 1 : -1].tobytes().decode())
+                        key = self._readKey(indent + 1, -1)
                         self._indent.key = key
                         self._readln()
                         value = List()
@@ -729,11 +792,11 @@ class ALACS:
                         self._readList(value)
                         self._indent = self._indent.less()
                 case 123:
-                    if size < 2 or self._line[-1] != 125:
+                    if size < 2 or line[-1] != 125:
                         self._errors_add("malformed associative array opening")
                         self._readln()
                     else:
-                        key = Key(self._line[indent + 1 : -1].tobytes().decode())
+                        key = self._readKey(indent + 1, -1)
                         self._indent.key = key
                         self._readln()
                         value = Dict()
@@ -745,16 +808,15 @@ class ALACS:
                         self._errors_add("malformed `key=value` association")
                         self._readln()
                     else:
-                        key = Key(self._line[indent : self._assign].tobytes().decode())
+                        key = self._readKey(indent, self._assign)
                         self._indent.key = key
-                        value = Text(self._line[self._assign + 1 :])
+                        value = Text(line[self._assign + 1 :])
                         self._readln()
             if value is None:
                 assert key is None
             else:
-                if self._tabs == indent:
-                    if len(self._line) > indent and self._line[indent] == 35:
-                        value.comment_after = self._readComment(indent + 1)
+                if self._tabs == indent and self._lead == 35:
+                    value.comment_after = self._readComment(indent + 1)
                 assert key is not None
                 array[key] = value
                 if blank:
@@ -766,6 +828,7 @@ class ALACS:
                 entries += 1
                 if len(array) != entries:
                     self._errors_add(f"duplicate key: {key}")
-            self._readExcess()
+            if self._tabs > indent:
+                self._readExcess()
         if comment or blank:
             self._errors_add("unclaimed key comment or blank line")
@@ -1,13 +1,20 @@
-from io import StringIO
+from functools import cache
+
+
+@cache
+def _tabs(depth: int) -> bytes:
+    """`_bytes` for each depth, shared by every chain (each `ALACS` has its own)."""
+    return b"\t" * depth
 
 
 class Indent:
-    __slots__ = ("_bytes", "_more", "_less", "key")
+    __slots__ = ("_bytes", "_newline", "_more", "_less", "key")
 
     def __init__(self, value: bytes):
-        if value.count(b"\t") != len(value):
+        if value.strip(b"\t"):  # one pass, anything left over is not a tab
             raise AssertionError("indent must be tab chars only")
         self._bytes = value
+        self._newline = b"\n" + value  # what `ALACS` writes to start each line
         self._more: Indent | None = None
         self._less: Indent | None = None
         self.key: str | int | None = None
@@ -15,7 +22,7 @@ class Indent:
     def more(self) -> "Indent":
         result = self._more
         if result is None:
-            result = self._more = Indent(self._bytes + b"\t")
+            result = self._more = Indent(_tabs(len(self._bytes) + 1))
             result._less = self
         else:
             result.key = None
@@ -41,22 +48,20 @@ class Indent:
         return len(self._bytes)
 
     def __repr__(self) -> str:
-        return f"<Indent {len(self)} @{self.path().getvalue()}>"
+        return f"<Indent {len(self)} @{self.path()}>"
 
-    def path(self, into: StringIO | None = None) -> StringIO:
+    def path(self) -> str:
         if self._less is not None:
-            into = self._less.path(into)
+            prefix = self._less.path()
         elif self.key is None:
             # often the zeroth key is None and the File key is in 1st indent...
-            return into or StringIO()
-        elif into is None:
-            into = StringIO()
-        into.write("/")
+            return ""
+        else:
+            prefix = ""
         match self.key:
             case str(key):
-                into.write(key)
+                return f"{prefix}/{key}"
             case key if key is ...:
-                into.write("~...") # for testing purposes
+                return f"{prefix}/~..." # for testing purposes
             case key:
-                into.write(str(key).replace("~","~0").replace("/","~1"))
-        return into
+                return f"{prefix}/{str(key).replace("~","~0").replace("/","~1")}"
@@ -1,10 +1,29 @@
+from collections.abc import Callable
+from functools import cache
 from io import BytesIO
+from typing import BinaryIO
 from . import File, Dict, List, Text, Comment, Value, Key, Encoded
 
 __all__ = ["YAML"]
 
 
-class YAML(BytesIO):
+# nesting depth is small while entries are many: format each depth once.
+@cache
+def _more(indent: bytes) -> bytes:
+    return indent + b" "
+
+
+@cache
+def _marked(indent: bytes) -> bytes:
+    return indent + b"#%d" % len(indent)
+
+
+def _discard(data: bytes) -> int:
+    """`YAML._write` between encodes, so no sink is kept alive."""
+    return 0
+
+
+class YAML:
     """Produces YAML that is not particularly aesthetically pleasing.
 
     This class prioritizes simple code that preserves all the input. No attempt is made
@@ -12,46 +31,73 @@ class YAML(BytesIO):
     comments are preserved) can clean things up.
     """
 
+    __slots__ = ("_blank", "_write", "_quoted")
+
     def __init__(self):
-        self._scratch = list[Encoded]()
         self._blank = Comment()
+        self._quoted = dict[str, bytes]()  # `_key` output, kept for one `encode`
+        self._write: Callable[[bytes], object] = _discard
+
+    def encode(self, alacs: File, out: BinaryIO | None = None) -> BinaryIO:
+        """Stream the YAML for `alacs` to `out` (a new `BytesIO` if None) and return it.
 
-    def encode(self, alacs: File) -> BytesIO:
-        self.seek(0)
-        self.truncate()
-        self.write(b"--- !map\n")
-        self._comment(b"", b"!", alacs.hashbang)
-        self._dict(b"",False, alacs)
-        self.write(b"...\n")
-        return self
+        The sink is not kept after returning."""
+        if out is None:
+            out = BytesIO()
+        self._write = out.write
+        try:
+            self._write(b"--- !map\n")
+            self._comment(b"", b"!", alacs.hashbang)
+            self._dict(b"",False, alacs)
+            self._write(b"...\n")
+        finally:
+            self._write = _discard
+            self._quoted.clear()
+        return out
 
     def _utf8(self, indent: bytes, prefix: bytes, alacs: list[Encoded]) -> None:
-        for line in alacs:
-            self.write(indent)
-            self.write(prefix)
-            self.write(line)
-            self.write(b"\n")
+        if alacs:
+            start = indent + prefix
+            self._write(start)
+            self._write((b"\n" + start).join(alacs))  # all the lines in one C call
+            self._write(b"\n")
 
     def _comment(self, indent: bytes, prefix: bytes, alacs: Comment | None) -> None:
-        if alacs is not None:
-            marked = b"#" if prefix == b"!" else b"#%d" % len(indent)
-            alacs.normalize(self._scratch)
-            self._utf8(indent + marked, prefix, alacs)
+        if alacs:
+            # `bytes` joins in C, taking in memoryviews and embedded LFs; only an entry
+            # holding a LF (or `[b""]`) needs the Python-level `normalize` in place.
+            lines = bytes(alacs)
+            if not lines or lines.count(b"\n") >= len(alacs):
+                alacs.normalize()
+            if alacs:
+                marked = indent + b"#" if prefix == b"!" else _marked(indent)
+                start = marked + prefix
+                self._write(start)
+                self._write(lines.replace(b"\n", b"\n" + start))
+                self._write(b"\n")
 
     def _value(self, indent: bytes, key: Key | bool, alacs: Value) -> None:
-        match alacs:
-            case Text():
-                self._text(indent, key, alacs)
-            case List():
-                self._list(indent, key, alacs)
-            case Dict():
-                self._dict(indent, key, alacs)
-            case _:
-                raise ValueError(f"unexpected type: {type(alacs)}")
+        kind = type(alacs)
+        if kind is Text:
+            self._text(indent, key, alacs)
+        elif kind is List:
+            self._list(indent, key, alacs)
+        elif kind is Dict:
+            self._dict(indent, key, alacs)
+        else:
+            match alacs:  # subclasses miss the exact-type dispatch
+                case Text():
+                    self._text(indent, key, alacs)
+                case List():
+                    self._list(indent, key, alacs)
+                case Dict():
+                    self._dict(indent, key, alacs)
+                case _:
+                    raise ValueError(f"unexpected type: {type(alacs)}")
         self._comment(indent, b"a:", alacs.comment_after)
 
     def _text(self, indent: bytes, key: Key | bool, value: Text) -> None:
-        value.normalize(self._scratch)
+        value.normalize()
         if value and not value[-1]:
             self._key(indent, key, b"|2+")
             self._utf8(indent, b"  ", value[:-1])
@@ -65,7 +111,7 @@ class YAML(BytesIO):
         else:
             assert key is not False
             self._key(indent, key, b"")
-            indent = indent + b" "
+            indent = _more(indent)
             self._comment(indent, b"i:", alacs.comment_intro)
             for value in alacs:
                 self._value(indent, True, value)
@@ -76,7 +122,7 @@ class YAML(BytesIO):
         else:
             if key is not False:
                 self._key(indent, key, b"")
-                indent = indent + b" "
+                indent = _more(indent)
             self._comment(indent, b"i:", alacs.comment_intro)
             for key, value in alacs.items():
                 if key.blank_line_before:
@@ -85,27 +131,29 @@ class YAML(BytesIO):
                 self._value(indent, key, value)
 
     def _key(self, indent: bytes, key: Key | bool, end: bytes) -> None:
-        self.write(indent)
-        match key:
-            case False:
-                self.write(end)
-            case True:
-                self.write(b"-")
-                if end:
-                    self.write(b" ")
-                    self.write(end)
-            case Key():
-                self.write(b'"')
-                self.write(
-                    key.replace("\\", r"\\")
-                    .replace('"', r"\"")
-                    .replace("\t", r"\t")
-                    .encode()
-                )
-                self.write(b'":')
-                if end:
-                    self.write(b" ")
-                    self.write(end)
-            case _:
-                raise ValueError(f"unexpected type: {type(key)}")
-        self.write(b"\n")
+        self._write(indent)
+        if key is True:
+            self._write(b"-")
+            if end:
+                self._write(b" ")
+                self._write(end)
+        elif key is False:
+            self._write(end)
+        elif isinstance(key, Key):
+            quoted = self._quoted.get(key)
+            if quoted is None:
+                escaped: str = key
+                if "\\" in key or '"' in key or "\t" in key:  # rare, so test first
+                    escaped = (
+                        key.replace("\\", r"\\")
+                        .replace('"', r"\"")
+                        .replace("\t", r"\t")
+                    )
+                quoted = self._quoted[key] = b'"' + escaped.encode() + b'":'
+            self._write(quoted)
+            if end:
+                self._write(b" ")
+                self._write(end)
+        else:
+            raise ValueError(f"unexpected type: {type(key)}")
+        self._write(b"\n")
@@ -1,7 +1,7 @@
 from collections.abc import Mapping
 from io import BytesIO
 from time import perf_counter_ns
-from typing import NamedTuple, Any, Self
+from typing import BinaryIO, NamedTuple, Any, Self
 
 from alacs import ALACS, File, Encoded, Comment
 import alacs.yaml
@@ -22,9 +22,9 @@ class StealComments(alacs.yaml.YAML):
         super().__init__()
         self.comments = list[str]()
 
-    def encode(self, alacs: File) -> BytesIO:
+    def encode(self, alacs: File, out: BinaryIO | None = None) -> BinaryIO:
         self.comments.clear()
-        return super().encode(alacs)
+        return super().encode(alacs, out)
 
     def _comment(self, indent: bytes, prefix: bytes, alacs: Comment | None) -> None:
         super()._comment(indent, prefix, alacs)
@@ -112,7 +112,8 @@ class TimedRuamel:
         self.alacs_timer = Timer()
         self.dump_timer = Timer(memory.encode_timer)
         self.load_timer = Timer(memory.decode_timer)
-        self.buffer = alacs.yaml.YAML()
+        self.buffer = BytesIO()
+        self.yaml = alacs.yaml.YAML()
         self.ruamel = ruamel.yaml.YAML(typ="rt")
         self.ruamel.indent(mapping=2, sequence=4, offset=2)
         if self.preserves(b"comment", b"{}\n#comment"):
@@ -158,7 +159,9 @@ class TimedRuamel:
 
     def translate(self, file: File) -> CommentedMap:
         with self.alacs_timer:
-            self.buffer.encode(file)
+            self.buffer.seek(0)
+            self.buffer.truncate()
+            self.yaml.encode(file, self.buffer)
         return self._load_file()
 
     def timers(self) -> None:
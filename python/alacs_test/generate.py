@@ -18,7 +18,7 @@ class Random:
         self.indent = Indent(b"")
 
     def _comment(self, kind: str) -> Comment:
-        result = Comment(f"{self.indent.path().getvalue()} {kind}")
+        result = Comment(f"{self.indent.path()} {kind}")
         for loop in range(randrange(3)):
             result.append(bytes(choices(self.comment, k=randrange(80))))
         if len(result) == 1 and not result[0]:
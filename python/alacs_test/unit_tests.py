@@ -1,5 +1,6 @@
 import re
-from collections import UserString
+from collections import OrderedDict, UserList, UserString
+from io import BytesIO
 from typing import Any, TypeAlias, ClassVar, ContextManager
 import unittest
 import alacs_test
@@ -19,6 +20,18 @@ class BadFile(File):
         self.message = message
 
 
+class SubText(Text):
+    __slots__ = ()
+
+
+class SubList(List):
+    __slots__ = ()
+
+
+class SubDict(Dict):
+    __slots__ = ()
+
+
 class Impossible(ALACS):
     """a broken subclass that returns an impossible result from select methods."""
 
@@ -119,11 +132,23 @@ class TestIndent(TestCase):
         for index in range(len(indents)):
             self.assertIsNone(indents[index].key)
 
+    def test_path_follows_keys(self):
+        root = Indent(b"")
+        root.key = "a"
+        child = root.more()
+        child.key = "b"
+        self.assertEqual(child.path(), "/a/b")
+        root.key = "z"
+        self.assertEqual(child.path(), "/z/b")
+
 
 class TestYAML(TestCase):
+    @staticmethod
+    def document(*lines: bytes) -> bytes:
+        return b"--- !map\n" + b"\n".join(lines) + b"\n...\n"
+
     def assertEncoded(self, file: File, *lines: bytes) -> None:
-        yaml = b"--- !map\n" + b"\n".join(lines) + b"\n...\n"
-        self.assertEqual(YAML().encode(file).getvalue(), yaml)
+        self.assertEqual(YAML().encode(file).getvalue(), self.document(*lines))
 
     def test_empty_file(self):
         self.assertEncoded(File(), b"{}")
@@ -140,6 +165,46 @@ class TestYAML(TestCase):
     def test_text_tricky(self):
         self.assertEncoded(File(t=Text("\no\nt\n")), b'"t": |2+\n  \n  o\n  t')
 
+    def test_subclasses(self):
+        file = File(t=SubText("v"), l=SubList(), d=SubDict())
+        self.assertEncoded(file, b'"t": |2-\n  v', b'"l": []', b'"d": {}')
+
+    def test_overrides(self):
+        class Folded(YAML):
+            def _text(self, indent: bytes, key: Key | bool, value: Text) -> None:
+                self._key(indent, key, b">-")
+                self._utf8(indent, b"  ", value)
+
+        file = File(t=Text("v"), l=List(Text("i")))
+        yaml = b'--- !map\n"t": >-\n  v\n"l":\n - >-\n   i\n...\n'
+        self.assertEqual(Folded().encode(file).getvalue(), yaml)
+
+    def test_key_escaped(self):
+        key = 'a"b\\\t'
+        file = File(d=Dict(**{key: Text()}), **{key: Dict(**{key: Text()})})
+        quoted = b'"a\\"b\\\\\\t":'
+        lines = [b'"d":', b" " + quoted + b" |2-", quoted, b" " + quoted + b" |2-"]
+        yaml = YAML()
+        self.assertEqual(yaml.encode(file).getvalue(), self.document(*lines))
+        self.assertEqual(yaml._quoted, {})  # not kept past `encode`
+
+    def test_comments(self):
+        after = Comment("a\nb", memoryview(b"c"))
+        file = File(t=Text(after=after), e=Text(after=Comment()))
+        file.hashbang = Comment("")
+        self.assertEncoded(file, b'"t": |2-', b"#0a:a\n#0a:b\n#0a:c", b'"e": |2-')
+        self.assertEqual(after, Comment("a", "b", "c"))  # normalized, as Text is
+        self.assertEqual(file.hashbang, Comment())
+
+    def test_sink(self):
+        out = BytesIO(b"before\n")
+        out.seek(0, 2)
+        yaml = YAML()
+        self.assertIs(yaml.encode(File(), out), out)
+        self.assertEqual(out.getvalue(), b"before\n--- !map\n{}\n...\n")
+        yaml._key(b"", True, b"")  # the sink was let go
+        self.assertEqual(out.getvalue(), b"before\n--- !map\n{}\n...\n")
+
     def test_bad_value(self):
         with self.assertValueError("unexpected type: <class 'ellipsis'>"):
             YAML()._value(b"", False, ...)  # type: ignore
@@ -235,6 +300,20 @@ class TestPython(TestCase):
         with self.assertValueError(bad_file.message):
             ALACS().python(bad_file)
 
+    def test_subclasses(self):
+        file = File(t=SubText("v"), l=SubList(SubText()), d=SubDict())
+        expect = {"t": "v", "l": [""], "d": {}}
+        self.assertEqual(ALACS().python(file), expect)
+
+    def test_overrides(self):
+        class Upper(ALACS):
+            def _pythonText(self, any: Text) -> str:
+                return str(any).upper()
+
+        file = File(t=Text("v"), l=List(Text("i")), d=Dict(k=Text("w")))
+        expect = {"t": "V", "l": ["I"], "d": {"k": "W"}}
+        self.assertEqual(Upper().python(file), expect)
+
 
 class TestFile(TestCase):
     def test_impossible_none_no_error(self):
@@ -248,6 +327,19 @@ class TestFile(TestCase):
     def test_none_is_empty_text(self):
         self.assertEqual(File(k=Text()), ALACS().file({"k": None}))
 
+    def test_subclasses(self):
+        mapping = OrderedDict(t=UserString("v"), l=UserList([Key("i")]))
+        expect = File(t=Text("v"), l=List(Text("i")))
+        self.assertEqual(ALACS().file(mapping), expect)
+
+    def test_overrides(self):
+        class Upper(ALACS):
+            def _valueText(self, any: Any) -> Text:
+                return Text(any.upper())
+
+        expect = File(t=Text("V"), l=List(Text("I")), d=Dict(k=Text("W")))
+        self.assertEqual(Upper().file({"t": "v", "l": ["i"], "d": {"k": "w"}}), expect)
+
     illegal: ClassVar[str] = "can't be converted to `Value`"
 
     def test_illegal_key(self):
@@ -275,6 +367,11 @@ class TestEncode(TestCase):
             alacs = buffer.tobytes().decode()
             self.assertEqual(alacs, "k=\n#")
 
+    def test_subclasses(self):
+        file = File(t=SubText("v"), l=SubList(SubText("i")), d=SubDict())
+        with ALACS().encode(file) as buffer:
+            self.assertEqual(buffer.tobytes(), b"t=v\n[l]\n\ti\n{d}")
+
     illegal: ClassVar[str] = "illegal non-`Value` data"
 
     def test_illegal_key(self):